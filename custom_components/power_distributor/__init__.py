@@ -4,11 +4,20 @@ from __future__ import annotations
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 
-from .const import DOMAIN, PLATFORMS
+from .const import DOMAIN, PLATFORMS, CONF_RAMP_20_PERCENT
+
+# Key under which older entries stored the 20% ramp time (mistyped upper-case suffix)
+LEGACY_CONF_RAMP_20_PERCENT = "ramp_20_PERCENT"
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Power Distributor from a config entry."""
+    # Rename the legacy ramp key so the sensor platform finds the value under the current key
+    if LEGACY_CONF_RAMP_20_PERCENT in entry.data:
+        data = dict(entry.data)
+        data[CONF_RAMP_20_PERCENT] = data.pop(LEGACY_CONF_RAMP_20_PERCENT)
+        hass.config_entries.async_update_entry(entry, data=data)
+
     # Store configuration data in hass.data for the sensor platform to access
     hass.data.setdefault(DOMAIN, {})[entry.entry_id] = entry.data
 
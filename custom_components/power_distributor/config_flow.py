@@ -36,6 +36,9 @@ from .const import (
 
 _LOGGER = logging.getLogger(__name__)
 
+# Validator for limits and time constants: coerced to float and strictly positive
+POSITIVE_FLOAT = vol.All(vol.Coerce(float), vol.Range(min=0.001))
+
 # Schema for Step 1: Entities and Main Limits
 STEP_USER_SCHEMA = vol.Schema({
     vol.Required(CONF_NAME, default="Power Distributor"): str,
@@ -45,19 +48,19 @@ STEP_USER_SCHEMA = vol.Schema({
     vol.Required(CONF_ENTITY_UNIT_2): str,
     vol.Required(CONF_ENTITY_UNIT_3): str,
     vol.Required(CONF_ENTITY_UNIT_4): str,
-    # Parameter Inputs (Coerced to float)
-    vol.Required(CONF_MAX_COMBINED_LOAD, default=DEFAULT_MAX_COMBINED_LOAD): vol.Coerce(float),
-    vol.Required(CONF_MAX_INDIVIDUAL_LOAD, default=DEFAULT_MAX_INDIVIDUAL_LOAD): vol.Coerce(float),
+    # Parameter Inputs (Coerced to positive float)
+    vol.Required(CONF_MAX_COMBINED_LOAD, default=DEFAULT_MAX_COMBINED_LOAD): POSITIVE_FLOAT,
+    vol.Required(CONF_MAX_INDIVIDUAL_LOAD, default=DEFAULT_MAX_INDIVIDUAL_LOAD): POSITIVE_FLOAT,
 })
 
-# Schema for Step 2: OA Tuning Parameters (All Coerced to float, in Minutes)
+# Schema for Step 2: OA Tuning Parameters (All Coerced to positive float, in Minutes)
 STEP_TUNING_SCHEMA = vol.Schema({
-    vol.Required(CONF_DELAY_5_PERCENT, default=DEFAULT_DELAY_5_PERCENT): vol.Coerce(float),
-    vol.Required(CONF_DELAY_20_PERCENT, default=DEFAULT_DELAY_20_PERCENT): vol.Coerce(float),
-    vol.Required(CONF_RAMP_5_PERCENT, default=DEFAULT_RAMP_5_PERCENT): vol.Coerce(float),
-    vol.Required(CONF_RAMP_20_PERCENT, default=DEFAULT_RAMP_20_PERCENT): vol.Coerce(float),
-    vol.Required(CONF_RECOVERY_TIME_FAST, default=DEFAULT_RECOVERY_TIME_FAST): vol.Coerce(float),
-    vol.Required(CONF_RECOVERY_TIME_SLOW, default=DEFAULT_RECOVERY_TIME_SLOW): vol.Coerce(float),
+    vol.Required(CONF_DELAY_5_PERCENT, default=DEFAULT_DELAY_5_PERCENT): POSITIVE_FLOAT,
+    vol.Required(CONF_DELAY_20_PERCENT, default=DEFAULT_DELAY_20_PERCENT): POSITIVE_FLOAT,
+    vol.Required(CONF_RAMP_5_PERCENT, default=DEFAULT_RAMP_5_PERCENT): POSITIVE_FLOAT,
+    vol.Required(CONF_RAMP_20_PERCENT, default=DEFAULT_RAMP_20_PERCENT): POSITIVE_FLOAT,
+    vol.Required(CONF_RECOVERY_TIME_FAST, default=DEFAULT_RECOVERY_TIME_FAST): POSITIVE_FLOAT,
+    vol.Required(CONF_RECOVERY_TIME_SLOW, default=DEFAULT_RECOVERY_TIME_SLOW): POSITIVE_FLOAT,
 })
 
 
@@ -67,24 +70,25 @@ class PowerDistributorConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     VERSION = 1
     _user_data: dict[str, Any] = {}
 
+    def _suggested_schema(self, schema: vol.Schema) -> vol.Schema:
+        """Return the schema for a step, pre-filled with the data entered so far."""
+        if not self._user_data:
+            # First render: nothing to suggest, use the base schema as-is
+            return schema
+        return self.add_suggested_values_to_schema(schema, self._user_data)
+
     async def async_step_user(
         self, user_input: dict[str, Any] | None = None
     ) -> config_entries.FlowResult:
         """Handle the initial step (Entities and Main Limits)."""
-        errors: dict[str, str] = {}
-
         if user_input is not None:
-            if user_input[CONF_MAX_COMBINED_LOAD] <= 0 or user_input[CONF_MAX_INDIVIDUAL_LOAD] <= 0:
-                errors["base"] = "positive_limits_required"
-            
-            if not errors:
-                self._user_data.update(user_input)
-                return await self.async_step_tuning()
+            # Limits are validated (strictly positive) by the schema itself
+            self._user_data.update(user_input)
+            return await self.async_step_tuning()
 
         return self.async_show_form(
             step_id="user", 
-            data_schema=self.add_suggested_values_to_schema(STEP_USER_SCHEMA, self._user_data), 
-            errors=errors
+            data_schema=self._suggested_schema(STEP_USER_SCHEMA)
         )
 
     async def async_step_tuning(
@@ -107,7 +111,7 @@ class PowerDistributorConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
         return self.async_show_form(
             step_id="tuning", 
-            data_schema=self.add_suggested_values_to_schema(STEP_TUNING_SCHEMA, self._user_data), 
+            data_schema=self._suggested_schema(STEP_TUNING_SCHEMA), 
             errors=errors,
             description_placeholders={"description": "Set the time constants (in minutes) for Overload Acceptance (OA) recovery and ramp-down."}
         )
\ No newline at end of file
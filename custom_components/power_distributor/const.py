@@ -19,7 +19,7 @@ CONF_MAX_INDIVIDUAL_LOAD = "max_individual_load"   # Y (Individual hard cap)
 CONF_DELAY_5_PERCENT = "delay_5_percent"           # Time (T_delay) allowed at 5% overload before OA starts dropping
 CONF_DELAY_20_PERCENT = "delay_20_percent"         # Time (T_delay) allowed at 20% overload before OA starts dropping
 CONF_RAMP_5_PERCENT = "ramp_5_percent"             # Time (T_ramp) to ramp limit down from overload to X (at 5% overload trigger)
-CONF_RAMP_20_PERCENT = "ramp_20_PERCENT"           # Time (T_ramp) to ramp limit down from overload to X (at 20% overload trigger)
+CONF_RAMP_20_PERCENT = "ramp_20_percent"           # Time (T_ramp) to ramp limit down from overload to X (at 20% overload trigger)
 CONF_RECOVERY_TIME_FAST = "recovery_time_fast"     # Time (T_recover) for OA to recover 0->100% when 20% UNDER load
 CONF_RECOVERY_TIME_SLOW = "recovery_time_slow"     # Time (T_recover) for OA to recover 0->100% when at RATED load
 
@@ -35,4 +35,5 @@ DEFAULT_RECOVERY_TIME_SLOW = 60.0
 
 # General
 NUM_CONSUMERS = 4
-SCAN_INTERVAL_SECONDS = 5
+SCAN_INTERVAL_SECONDS = 60                         # Safety heartbeat while every OA state is idle
+ACTIVE_SCAN_INTERVAL_SECONDS = 5                   # Heartbeat while any OA state is consuming, ramping or recovering
@@ -3,16 +3,23 @@ with time-based Overload Acceptance (OA) state machine logic."""
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import math
-from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional
+import sys
+import time
+from datetime import timedelta
+from typing import Any, Callable, Dict, List, Optional
 
 from homeassistant.components.sensor import SensorEntity, SensorDeviceClass
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant, callback, State
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback, State
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.event import async_track_state_change_event, async_track_time_interval
+from homeassistant.helpers.event import (
+    async_call_later,
+    async_track_state_change_event,
+    async_track_time_interval,
+)
 from homeassistant.const import STATE_UNAVAILABLE, STATE_UNKNOWN
 
 from .const import (
@@ -31,7 +38,8 @@ from .const import (
     CONF_RECOVERY_TIME_FAST,
     CONF_RECOVERY_TIME_SLOW,
     NUM_CONSUMERS,
-    SCAN_INTERVAL_SECONDS
+    SCAN_INTERVAL_SECONDS,
+    ACTIVE_SCAN_INTERVAL_SECONDS,
 )
 
 _LOGGER = logging.getLogger(__name__)
@@ -48,26 +56,17 @@ def get_float_state(state: State | None) -> float | None:
     except (ValueError, TypeError):
         return None
 
-def _interpolate_value(x: float, x1: float, y1: float, x2: float, y2: float) -> float:
-    """Linear interpolation between two points (x1, y1) and (x2, y2)."""
-    if x1 == x2: 
-        return y1 
-    if x <= x1: 
-        return y1
-    if x >= x2: 
-        return y2
-    return y1 + (x - x1) * (y2 - y1) / (x2 - x1)
-
 
 # --- Power Management (OA State Machine) ---
 
 class PowerManagement:
     """Manages the shared time-dependent state (OA) and overload logic for combined and individual loads."""
 
-    def __init__(self, hass: HomeAssistant, config: dict):
+    def __init__(self, hass: HomeAssistant, config: dict, clock: Callable[[], float] = time.monotonic):
         """Initialize the Power Management with dynamic configuration."""
         self.hass = hass
         self._config = config
+        self._clock = clock # Monotonic clock in seconds (immune to wall-clock jumps)
         
         # Limits
         self.max_combined_load = config[CONF_MAX_COMBINED_LOAD]
@@ -81,39 +80,55 @@ class PowerManagement:
         self._recover_fast = config[CONF_RECOVERY_TIME_FAST]
         self._recover_slow = config[CONF_RECOVERY_TIME_SLOW]
 
-        # Shared OA State variables for Combined Load
-        self._combined_oa = 100.0
-        self._combined_ramp_start = None
-        self._combined_ramp_dur = None
-        self._combined_init_factor = 1.0
+        # Precomputed interpolation slopes (per unit of ratio) for the OA timing curves
+        self._delay_slope = (self._delay_20 - self._delay_5) / 0.15       # 5% -> 20% overload (1.05 -> 1.20)
+        self._ramp_slope = (self._ramp_20 - self._ramp_5) / 0.15          # 5% -> 20% overload (1.05 -> 1.20)
+        self._recover_slope = (self._recover_slow - self._recover_fast) / 0.20  # 20% under -> rated (0.80 -> 1.00)
+
+        # Shared OA State for Combined Load (same layout as the individual consumer states)
+        self._combined_state = {'oa': 100.0, 'ramp_start': None, 'init_factor': 1.0, 'ramp_dur': None}
         
         # Shared OA State variables for Individual Consumers (list of dictionaries)
         self._consumer_oa_states = [
             {'oa': 100.0, 'ramp_start': None, 'init_factor': 1.0, 'ramp_dur': None}
             for _ in range(NUM_CONSUMERS)
         ]
-        self._last_update_time = datetime.now()
+        self._last_update_monotonic = clock()
+
+        # Inputs of the previous tick (used to skip recomputation in steady state)
+        self._last_inputs: tuple[float, tuple[float, ...]] | None = None
+
+        # Result dict, updated in place every tick (unrounded; rounding happens in the sensor attributes)
+        self._result_tmpl: dict[str, Any] = {
+            "combined_oa_percent": 100.0,
+            "current_combined_limit_A": 0.0,
+            "available_managed_capacity_A": 0.0,
+            "individual_oa_percents": [100.0] * NUM_CONSUMERS,
+            "final_limits_A": [0.0] * NUM_CONSUMERS,
+            "units_pre_capped_demand_A": [0.0] * NUM_CONSUMERS,
+        }
 
 
     def _calculate_oa_timing(self, overload_ratio: float) -> tuple[float, float]:
         """Calculates T_delay and T_ramp based on overload ratio (capped at 1.20). Returns (T_delay, T_ramp) in minutes."""
-        ratio = min(1.20, overload_ratio)
+        offset = min(1.20, max(1.05, overload_ratio)) - 1.05
         
-        T_delay = _interpolate_value(ratio, 1.05, self._delay_5, 1.20, self._delay_20)
-        T_ramp = _interpolate_value(ratio, 1.05, self._ramp_5, 1.20, self._ramp_20)
+        T_delay = self._delay_5 + offset * self._delay_slope
+        T_ramp = self._ramp_5 + offset * self._ramp_slope
         
         return T_delay, T_ramp
 
     def _calculate_recovery_time(self, load_ratio: float) -> float:
         """Calculates T_recover (time in minutes for OA to go from 0 to 100)."""
         # Interpolates between 20% under-load (0.80) and rated load (1.00)
-        return _interpolate_value(load_ratio, 0.80, self._recover_fast, 1.00, self._recover_slow)
+        return self._recover_fast + (min(1.00, max(0.80, load_ratio)) - 0.80) * self._recover_slope
 
 
-    def _update_oa_state(self, current_load: float, reference_limit: float, state: dict, time_delta_min: float) -> float:
-        """Generic OA state machine update. Returns the current limit factor (>=1.0 accepted, <1.0 ramping)."""
-        now = datetime.now()
-        
+    def _update_oa_state(self, current_load: float, reference_limit: float, state: dict, time_delta_min: float, now: float) -> float:
+        """Generic OA state machine update. Returns the current limit factor (>=1.0 accepted, <1.0 ramping).
+
+        `now` is the monotonic timestamp (seconds) of the current tick.
+        """
         # Avoid division by zero
         if reference_limit <= 0: return 1.0 
         
@@ -122,6 +137,11 @@ class PowerManagement:
         if current_load <= reference_limit:
             # --- RECOVERY (Load <= Limit) ---
             state['ramp_start'] = None
+
+            if state['oa'] >= 100.0:
+                # Fully recovered already: nothing to interpolate
+                state['oa'] = 100.0
+                return max(1.0, overload_ratio)
             
             # Recovery rate based on how far under the limit the load is (0.8 to 1.0)
             load_ratio = max(0.0, min(1.0, current_load / reference_limit)) 
@@ -154,7 +174,7 @@ class PowerManagement:
                     state['ramp_dur'] = T_ramp
                     state['init_factor'] = overload_ratio
                 
-                time_elapsed_min = (now - state['ramp_start']).total_seconds() / 60.0
+                time_elapsed_min = (now - state['ramp_start']) / 60.0
                 ramp_progress = min(1.0, time_elapsed_min / state['ramp_dur'])
                 
                 # Interpolate the limit factor from initial_overload_ratio down to 1.0
@@ -167,35 +187,59 @@ class PowerManagement:
                 
                 return current_limit_factor
 
-    def run_distribution(self, L_combined_actual: float, L_units_actual: list[float]) -> dict[str, Any]:
+    def _is_relaxed(self, L_combined_actual: float, L_units_actual: list[float]) -> bool:
+        """Return True if no OA state is consuming, ramping or recovering for the given loads."""
+        if L_combined_actual > self.max_combined_load or self._combined_state['oa'] < 100.0 \
+                or self._combined_state['ramp_start'] is not None:
+            return False
+        for requested_load, consumer_state in zip(L_units_actual, self._consumer_oa_states):
+            if requested_load > self.max_individual_load or consumer_state['oa'] < 100.0 \
+                    or consumer_state['ramp_start'] is not None:
+                return False
+        return True
+
+    def is_settled(self) -> bool:
+        """Return True if the last inputs leave every OA state fully recovered and idle."""
+        return self._last_inputs is not None and self._is_relaxed(self._last_inputs[0], self._last_inputs[1])
+
+    def run_distribution(self, L_combined_actual: float, L_units_actual: list[float]) -> tuple[dict[str, Any], bool]:
         """
         Runs the main logic, updates OA states, and calculates final proportional limits.
+
+        Returns (result, changed). The result dict is owned by the manager and updated in place on the
+        next call, so `changed` (False when the previous result was reused) is the only way to tell
+        whether its contents differ from the last call.
         """
-        now = datetime.now()
-        time_delta_sec = (now - self._last_update_time).total_seconds()
-        time_delta_min = time_delta_sec / 60.0
-        self._last_update_time = now
+        now = self._clock()
+        time_delta_min = (now - self._last_update_monotonic) / 60.0
+        self._last_update_monotonic = now
+
+        # Steady state: same inputs, all loads within limits and every OA fully recovered
+        # means the result cannot change, so reuse the previous one.
+        inputs = (L_combined_actual, tuple(L_units_actual))
+        if inputs == self._last_inputs and self._is_relaxed(L_combined_actual, L_units_actual):
+            return self._result_tmpl, False
+
+        if self._last_inputs is not None and inputs != self._last_inputs:
+            # The previous loads held until this change: integrate the elapsed time with them first,
+            # so the new loads only act from now on
+            prev_combined, prev_units = self._last_inputs
+            self._update_oa_state(prev_combined, self.max_combined_load, self._combined_state, time_delta_min, now)
+            for prev_load, consumer_state in zip(prev_units, self._consumer_oa_states):
+                self._update_oa_state(prev_load, self.max_individual_load, consumer_state, time_delta_min, now)
+            time_delta_min = 0.0
+        self._last_inputs = inputs
+        result = self._result_tmpl
         
         L_units_total = sum(L_units_actual)
         L_unmanaged_actual = max(0.0, L_combined_actual - L_units_total)
 
         # 1. --- Update COMBINED Overload Acceptance (OA_X) ---
-        combined_oa_state = {
-            'oa': self._combined_oa, 'ramp_start': self._combined_ramp_start,
-            'init_factor': self._combined_init_factor, 'ramp_dur': self._combined_ramp_dur
-        }
-
         # Calculate factor based on total combined load vs max combined load
         combined_limit_factor = self._update_oa_state(
-            L_combined_actual, self.max_combined_load, combined_oa_state, time_delta_min
+            L_combined_actual, self.max_combined_load, self._combined_state, time_delta_min, now
         )
         
-        # Update shared state variables
-        self._combined_oa = combined_oa_state['oa']
-        self._combined_ramp_start = combined_oa_state['ramp_start']
-        self._combined_init_factor = combined_oa_state['init_factor']
-        self._combined_ramp_dur = combined_oa_state['ramp_dur']
-        
         # Determine the COMBINED limit imposed by the OA logic
         if combined_limit_factor > 1.0:
             # In Delay phase: Limit is high (actual load)
@@ -209,50 +253,49 @@ class PowerManagement:
 
         # 2. --- Update INDIVIDUAL Overload Acceptance (OA_Y) ---
         
-        pre_capped_requests = []
-        individual_oa_percents = []
+        pre_capped_requests = result["units_pre_capped_demand_A"]
+        individual_oa_percents = result["individual_oa_percents"]
 
-        for i, requested_load in enumerate(L_units_actual):
-            consumer_state = self._consumer_oa_states[i]
+        # Bind loop invariants once; the loop stays generic over NUM_CONSUMERS
+        update_oa_state = self._update_oa_state
+        max_individual_load = self.max_individual_load
+        L_units_pre_capped_total = 0.0
 
+        for i, (requested_load, consumer_state) in enumerate(zip(L_units_actual, self._consumer_oa_states)):
             # Individual OA logic: Based on actual request vs individual limit (Y)
-            individual_limit_factor = self._update_oa_state(
-                requested_load, self.max_individual_load, consumer_state, time_delta_min
+            individual_limit_factor = update_oa_state(
+                requested_load, max_individual_load, consumer_state, time_delta_min, now
             )
             
-            individual_oa_percents.append(round(consumer_state['oa'], 2))
+            individual_oa_percents[i] = consumer_state['oa']
 
             # Unit's maximum capacity cap imposed by its OA state
-            consumer_oa_cap = self.max_individual_load * individual_limit_factor
+            consumer_oa_cap = max_individual_load * individual_limit_factor
             
             # The request for the proportional splitter is capped by: (1) OA limit, (2) Hard cap Y
             pre_capped_request = min(requested_load, consumer_oa_cap)
             
-            pre_capped_requests.append(pre_capped_request)
-
-        L_units_pre_capped_total = sum(pre_capped_requests)
+            pre_capped_requests[i] = pre_capped_request
+            L_units_pre_capped_total += pre_capped_request
 
         # 3. --- Proportional Distribution ---
-        final_limits = [0.0] * NUM_CONSUMERS
+        final_limits = result["final_limits_A"]
         
         if X_managed_capacity >= L_units_pre_capped_total:
             # Enough capacity: Units get their OA-capped request (which is also capped by Y)
-            final_limits = pre_capped_requests
+            final_limits[:] = pre_capped_requests
         else:
             # Capacity shortage: Apply proportional limiting based on available capacity
-            if L_units_pre_capped_total > 0:
-                scaling_factor = X_managed_capacity / L_units_pre_capped_total
-                final_limits = [load * scaling_factor for load in pre_capped_requests]
+            # (the total is > 0 here, since the capacity is never negative)
+            scaling_factor = X_managed_capacity / L_units_pre_capped_total
+            for i, load in enumerate(pre_capped_requests):
+                final_limits[i] = load * scaling_factor
         
         # Final result structure
-        return {
-            "combined_oa_percent": round(self._combined_oa, 2),
-            "current_combined_limit_A": round(current_combined_limit, 2),
-            "available_managed_capacity_A": round(X_managed_capacity, 2),
-            "individual_oa_percents": individual_oa_percents,
-            "final_limits_A": [round(l, 2) for l in final_limits],
-            "units_pre_capped_demand_A": [round(r, 2) for r in pre_capped_requests],
-        }
+        result["combined_oa_percent"] = self._combined_state['oa']
+        result["current_combined_limit_A"] = current_combined_limit
+        result["available_managed_capacity_A"] = X_managed_capacity
+        return result, True
 
 # --- Home Assistant Sensors ---
 
@@ -263,8 +306,19 @@ class PowerDistributorSensor(SensorEntity):
     _attr_native_unit_of_measurement = "A" # The main state will be the actual load
     _attr_should_poll = False
     
-    def __init__(self, entry_id: str, index: int, source_entity_id: str, name: str, is_combined: bool = False):
+    def __init__(
+        self,
+        entry_id: str,
+        index: int,
+        source_entity_id: str,
+        name: str,
+        manager: PowerManagement,
+        schedule_controller: Callable[[], None],
+        is_combined: bool = False,
+    ):
         """Initialize the sensor."""
+        self._manager = manager
+        self._schedule_controller = schedule_controller # Requests a (debounced) controller run
         self._source_entity_id = source_entity_id
         self._is_combined = is_combined
         self._index = index
@@ -273,6 +327,7 @@ class PowerDistributorSensor(SensorEntity):
         self._last_result = {} # Stores the result dict from PowerManagement
         self._last_actual_load: float | None = None
         self._state_is_valid = True
+        self._build_attrs()
 
     @property
     def native_value(self) -> State | None:
@@ -284,31 +339,31 @@ class PowerDistributorSensor(SensorEntity):
         """Return True if entity is available and state is valid."""
         return self._last_actual_load is not None and self._state_is_valid
 
-    @property
-    def extra_state_attributes(self) -> Dict[str, Any]:
-        """Return the calculated limits and OA status as attributes."""
+    def _build_attrs(self) -> None:
+        """Build the calculated limits and OA status attributes once per controller tick."""
         attrs = {
             "source_entity_id": self._source_entity_id,
         }
         
         if not self._last_result:
             attrs['status'] = "Initializing"
-            return attrs
+            self._attr_extra_state_attributes = attrs
+            return
 
         if self._is_combined:
             # Combined Load Attributes
             attrs.update({
-                "calculated_limit_combined_A": self._last_result.get("current_combined_limit_A"),
-                "combined_oa_percent": self._last_result.get("combined_oa_percent"),
-                "max_combined_load_x": self.hass.data[DOMAIN]['manager'].max_combined_load,
-                "available_managed_capacity_A": self._last_result.get("available_managed_capacity_A"),
+                "calculated_limit_combined_A": round(self._last_result["current_combined_limit_A"], 2),
+                "combined_oa_percent": round(self._last_result["combined_oa_percent"], 2),
+                "max_combined_load_x": self._manager.max_combined_load,
+                "available_managed_capacity_A": round(self._last_result["available_managed_capacity_A"], 2),
             })
         else:
             # Individual Unit Attributes
             attrs.update({
-                "calculated_limit_unit_A": self._last_result['final_limits_A'][self._index],
-                "individual_oa_percent": self._last_result['individual_oa_percents'][self._index],
-                "max_individual_load_y": self.hass.data[DOMAIN]['manager'].max_individual_load,
+                "calculated_limit_unit_A": round(self._last_result['final_limits_A'][self._index], 2),
+                "individual_oa_percent": round(self._last_result['individual_oa_percents'][self._index], 2),
+                "max_individual_load_y": self._manager.max_individual_load,
             })
         
         # Add friendly status based on the load vs the current calculated limit
@@ -318,37 +373,33 @@ class PowerDistributorSensor(SensorEntity):
         else:
              attrs['control_status'] = "Limit Enforced"
 
-        return attrs
+        self._attr_extra_state_attributes = attrs
 
     async def async_added_to_hass(self) -> None:
-        """Register state change listeners."""
-        # Listen only to changes in its own source entity to update its state
-        self.async_on_remove(
-            async_track_state_change_event(
-                self.hass, [self._source_entity_id], self._state_change_listener
-            )
-        )
-        # Initial run
-        await self.async_update()
-        
+        """Request a controller run so the initial state is pushed (source changes are tracked by the controller)."""
+        self._schedule_controller()
+
     @callback
-    def _state_change_listener(self, event) -> None:
-        """Handle state changes and trigger an update."""
-        self.async_schedule_update_ha_state(True)
-        
-    async def async_update(self) -> None:
-        """Update the sensor's actual load state."""
-        new_state = self.hass.states.get(self._source_entity_id)
-        
-        self._last_actual_load = get_float_state(new_state)
-        
-        if self._last_actual_load is None:
-            self._state_is_valid = False
-        else:
-            self._state_is_valid = True
+    def async_apply_results(self, actual_load: float | None, results: dict[str, Any], changed: bool) -> None:
+        """Push the load already parsed by the controller and the latest results, then write the state."""
+        if not changed and results is self._last_result and actual_load == self._last_actual_load:
+            # Nothing changed since the last tick: state and cached attributes are still valid
+            return
+        self._last_actual_load = actual_load
+        self._state_is_valid = actual_load is not None
+        self._last_result = results
+        self._build_attrs()
+        self.async_write_ha_state()
 
-        # All sensors rely on the main controller to run the calculation first
-        self._last_result = self.hass.data[DOMAIN].get('latest_results', {})
+    @callback
+    def async_apply_load(self, actual_load: float | None) -> None:
+        """Push only the parsed load (no new results this tick), keeping the previous results."""
+        if actual_load == self._last_actual_load and self._state_is_valid == (actual_load is not None):
+            return
+        self._last_actual_load = actual_load
+        self._state_is_valid = actual_load is not None
+        self._build_attrs()
+        self.async_write_ha_state()
 
 
 # --- Main Setup and Controller Logic ---
@@ -364,68 +415,144 @@ async def async_setup_entry(
     
     # 1. Initialize the shared Power Management logic (the "Brain")
     manager = PowerManagement(hass, data)
-    hass.data[DOMAIN]['manager'] = manager
-    hass.data[DOMAIN]['latest_results'] = {}
 
-    # 2. Create Output Sensors
-    sensors = []
-    
-    # Combined Load Sensor
-    sensors.append(
-        PowerDistributorSensor(
-            config_entry.entry_id, -1, data[CONF_ENTITY_COMBINED_LOAD], "Combined Load Status", True
-        )
-    )
-
-    # Individual Unit Sensors (4 units)
     unit_keys = [CONF_ENTITY_UNIT_1, CONF_ENTITY_UNIT_2, CONF_ENTITY_UNIT_3, CONF_ENTITY_UNIT_4]
-    for i, entity_key in enumerate(unit_keys):
-        sensors.append(
-            PowerDistributorSensor(
-                config_entry.entry_id, i, data[entity_key], f"Unit {i+1} Status"
-            )
-        )
-    
-    async_add_entities(sensors)
+    # Source entity ids, interned once as they key every state lookup in the controller
+    combined_entity = sys.intern(data[CONF_ENTITY_COMBINED_LOAD])
+    unit_entities = [sys.intern(data[key]) for key in unit_keys]
+    sensors: list[PowerDistributorSensor] = []
+    combined_unavailable_logged = False
 
-    # 3. Setup the Update Runner
+    # 2. Setup the Update Runner (before the sensors are added, so they can request a run)
     
     @callback
-    async def async_run_controller(now):
+    def async_run_controller(now=None) -> None:
         """Runs the Power Management logic and updates all sensor states."""
+        nonlocal combined_unavailable_logged
         
-        # --- Gather all inputs ---
-        combined_state = hass.states.get(data[CONF_ENTITY_COMBINED_LOAD])
+        # --- Gather all inputs (read and parsed once per tick, shared with the sensors) ---
+        combined_state = hass.states.get(combined_entity)
         L_combined_actual = get_float_state(combined_state)
+        sensor_loads = [L_combined_actual]
         
         L_units_actual = []
-        for entity_key in unit_keys:
-            unit_state = hass.states.get(data[entity_key])
+        for entity_id in unit_entities:
+            unit_state = hass.states.get(entity_id)
             load = get_float_state(unit_state)
+            sensor_loads.append(load)
             L_units_actual.append(load if load is not None else 0.0)
             
         # Check if critical input (combined load) is valid
         if L_combined_actual is None:
-            _LOGGER.warning("Combined load input is unavailable. Halting distribution calculation.")
+            # Warn once per outage; unit changes keep triggering the controller while it lasts
+            if not combined_unavailable_logged:
+                _LOGGER.warning("Combined load input is unavailable. Halting distribution calculation.")
+                combined_unavailable_logged = True
+            # Still refresh every sensor's own load (and availability), keeping the previous results
+            for entity, actual_load in zip(sensors, sensor_loads):
+                if entity.hass is not None:
+                    entity.async_apply_load(actual_load)
             return
+        combined_unavailable_logged = False
 
         # --- Run Logic ---
         try:
-            results = manager.run_distribution(L_combined_actual, L_units_actual)
-            hass.data[DOMAIN]['latest_results'] = results
+            results, changed = manager.run_distribution(L_combined_actual, L_units_actual)
             
-            # Request all sensor entities to update their states and attributes
-            for entity in sensors:
-                entity.async_schedule_update_ha_state(True)
+            # Push the results into every sensor that has been added to hass
+            for entity, actual_load in zip(sensors, sensor_loads):
+                if entity.hass is not None:
+                    entity.async_apply_results(actual_load, results, changed)
                 
         except Exception as e:
             _LOGGER.error(f"Error during power distribution calculation: {e}", exc_info=True)
+            return
+
+        # While any OA state is consuming, ramping or recovering, keep re-evaluating at a short interval
+        nonlocal active_heartbeat
+        if active_heartbeat is None and not manager.is_settled():
+            active_heartbeat = async_call_later(
+                hass, ACTIVE_SCAN_INTERVAL_SECONDS, _async_active_heartbeat
+            )
+
+    # Cancel function of the pending short (active OA) heartbeat, if any
+    active_heartbeat: CALLBACK_TYPE | None = None
+
+    @callback
+    def _async_active_heartbeat(now) -> None:
+        """Re-run the controller while the OA state machine is active."""
+        nonlocal active_heartbeat
+        active_heartbeat = None
+        async_run_controller()
+
+    # Debounce bursts of source state changes into a single controller run per loop tick
+    pending_run: asyncio.Handle | None = None
+
+    @callback
+    def _async_run_scheduled_controller() -> None:
+        """Run the controller once for all state changes collected since scheduling."""
+        nonlocal pending_run
+        pending_run = None
+        async_run_controller()
+
+    @callback
+    def async_schedule_controller() -> None:
+        """Schedule a controller run on the next loop iteration unless one is already pending."""
+        nonlocal pending_run
+        if pending_run is None:
+            pending_run = hass.loop.call_soon(_async_run_scheduled_controller)
+
+    @callback
+    def _async_cancel_pending_run() -> None:
+        """Cancel scheduled controller runs when the entry is unloaded."""
+        nonlocal pending_run, active_heartbeat
+        if pending_run is not None:
+            pending_run.cancel()
+            pending_run = None
+        if active_heartbeat is not None:
+            active_heartbeat()
+            active_heartbeat = None
+
+    config_entry.async_on_unload(_async_cancel_pending_run)
+
+    # 3. Create Output Sensors
+    
+    # Combined Load Sensor
+    sensors.append(
+        PowerDistributorSensor(
+            config_entry.entry_id, -1, combined_entity, "Combined Load Status",
+            manager, async_schedule_controller, True
+        )
+    )
+
+    # Individual Unit Sensors (4 units)
+    for i, entity_id in enumerate(unit_entities):
+        sensors.append(
+            PowerDistributorSensor(
+                config_entry.entry_id, i, entity_id, f"Unit {i+1} Status",
+                manager, async_schedule_controller
+            )
+        )
+    
+    async_add_entities(sensors)
 
+    # 4. Triggers
+
+    @callback
+    def _state_change_listener(event) -> None:
+        """Handle state changes of any source entity and schedule a controller run."""
+        async_schedule_controller()
+
+    # Listen once to the combined load and all unit entities
+    config_entry.async_on_unload(
+        async_track_state_change_event(hass, [combined_entity] + unit_entities, _state_change_listener)
+    )
 
-    # Run controller periodically (heartbeat) and whenever an entity state changes
-    hass.data[DOMAIN]['controller_update_listener'] = async_track_time_interval(
-        hass, async_run_controller, timedelta(seconds=SCAN_INTERVAL_SECONDS)
+    # Long safety-net heartbeat: state changes drive the controller, and a short heartbeat
+    # takes over while any OA state is active
+    config_entry.async_on_unload(
+        async_track_time_interval(hass, async_run_controller, timedelta(seconds=SCAN_INTERVAL_SECONDS))
     )
     
     # Initial run to populate the state immediately
-    await async_run_controller(datetime.now())
\ No newline at end of file
+    async_run_controller()
\ No newline at end of file